@@ -3,9 +3,13 @@
 Control the macOS Preview application using JXA-like syntax.
 """
 
-from typing import Union
+import functools
+from collections.abc import Sequence
+from typing import Any, Callable, Union
 
 import AppKit
+import objc
+import ScriptingBridge
 
 from PyXA import XABase
 from PyXA import XABaseScriptable
@@ -17,6 +21,58 @@ from ..XAProtocols import (
     XAPrintable,
 )
 
+# Property keys passed to set_property, bridged to NSString once at import so
+# that setters do not convert the key on every call.
+_P_FRONTMOST = AppKit.NSString.stringWithString_("frontmost")
+_P_DOCUMENT = AppKit.NSString.stringWithString_("document")
+_P_NAME = AppKit.NSString.stringWithString_("name")
+_P_PATH = AppKit.NSString.stringWithString_("path")
+
+
+def _pooled(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Runs the decorated method inside its own autorelease pool so that temporary Objective-C objects are released as soon as it returns.
+
+    .. versionadded:: 0.3.1
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with objc.autorelease_pool():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _XAPathListView(Sequence):
+    """A read-only, list-like view over an array of path strings that creates :class:`XABase.XAPath` objects on demand.
+
+    Slicing the view returns another view over the selected paths. Use ``list(view)`` to obtain a mutable list of :class:`XABase.XAPath` objects.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, paths: Union["AppKit.NSArray", None]):
+        self._paths = paths or []
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            return _XAPathListView(list(self._paths)[key])
+        return XABase.XAPath(self._paths[key])
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __iter__(self):
+        return (XABase.XAPath(x) for x in self._paths)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
 
 class XAPreviewApplication(
     XABaseScriptable.XASBApplication, XACanOpenPath, XACanPrintPath
@@ -39,14 +95,14 @@ class XAPreviewApplication(
 
     @frontmost.setter
     def frontmost(self, frontmost: bool):
-        self.set_property("frontmost", frontmost)
+        self.set_property(_P_FRONTMOST, frontmost)
 
-    @property
+    @functools.cached_property
     def name(self) -> str:
         """The name of the application."""
         return self.xa_scel.name()
 
-    @property
+    @functools.cached_property
     def version(self) -> str:
         """The version of Preview.app."""
         return self.xa_scel.version()
@@ -61,9 +117,10 @@ class XAPreviewApplication(
 
         .. versionadded:: 0.0.1
         """
-        if isinstance(path, str):
-            path = AppKit.NSURL.alloc().initFileURLWithPath_(path)
-        self.xa_scel.print_printDialog_withProperties_(path, show_prompt, None)
+        with objc.autorelease_pool():
+            if isinstance(path, str):
+                path = AppKit.NSURL.fileURLWithPath_(path)
+            self.xa_scel.print_printDialog_withProperties_(path, show_prompt, None)
 
     def documents(self, filter: dict = None) -> "XAPreviewDocumentList":
         """Returns a list of documents matching the filter.
@@ -109,7 +166,7 @@ class XAPreviewWindow(XABaseScriptable.XASBWindow, XABaseScriptable.XASBPrintabl
 
     @document.setter
     def document(self, document: "XAPreviewDocument"):
-        self.set_property("document", document.xa_elem)
+        self.set_property(_P_DOCUMENT, document.xa_elem)
 
     @property
     def floating(self) -> bool:
@@ -138,35 +195,101 @@ class XAPreviewDocumentList(XABase.XAList, XAClipboardCodable):
     def __init__(self, properties: dict, filter: Union[dict, None] = None):
         super().__init__(properties, XAPreviewDocument, filter)
 
+    def _snapshot(self) -> list["AppKit.NSObject"]:
+        """Copies the backing array into a Python list in a single pass.
+
+        .. versionadded:: 0.3.1
+        """
+        return list(self.xa_elem)
+
+    def __iter__(self):
+        """Iterates over the documents in the list.
+
+        Like Cocoa fast enumeration, the contents of the list are captured once when iteration begins; documents added or removed afterwards are not reflected.
+
+        .. versionadded:: 0.3.1
+        """
+        return (
+            self._new_element(document, XAPreviewDocument)
+            for document in self._snapshot()
+        )
+
+    @_pooled
     def properties(self) -> list[dict]:
         return list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
 
+    @_pooled
     def name(self) -> list[str]:
         return list(self.xa_elem.arrayByApplyingSelector_("name") or [])
 
-    def path(self) -> list[XABase.XAPath]:
-        ls = self.xa_elem.arrayByApplyingSelector_("path") or []
-        return [XABase.XAPath(x) for x in ls]
+    @_pooled
+    def path(self) -> Sequence[XABase.XAPath]:
+        """Gets the file path of each document in the list.
+
+        :return: A read-only sequence of document paths
+        :rtype: Sequence[XABase.XAPath]
 
+        .. versionchanged:: 0.3.1
+
+           Now returns a read-only, list-like sequence that creates :class:`XABase.XAPath` objects as they are accessed instead of a ``list``. Use ``list(docs.path())`` where a mutable list is needed.
+
+        .. versionadded:: 0.0.4
+        """
+        return _XAPathListView(self.xa_elem.arrayByApplyingSelector_("path"))
+
+    @_pooled
     def modified(self) -> list[str]:
         return list(self.xa_elem.arrayByApplyingSelector_("modified") or [])
 
     def by_properties(self, properties: dict) -> Union["XAPreviewDocument", None]:
         return self.by_property("properties", properties)
 
+    def _by_selector(
+        self, selector: str, value: Any
+    ) -> Union["XAPreviewDocument", None]:
+        """Retrieves the first document whose value for the given selector matches the provided value.
+
+        When the list is backed by a Scripting Bridge element array, the values for all documents are fetched in a single call and the resulting array is searched. Otherwise, the lookup falls back to :func:`XABase.XAList.by_property`.
+
+        :param selector: The selector of the property to match
+        :type selector: str
+        :param value: The value to match
+        :type value: Any
+        :return: The matching document, if one is found
+        :rtype: Union[XAPreviewDocument, None]
+
+        .. versionadded:: 0.3.1
+        """
+        if not isinstance(self.xa_elem, ScriptingBridge.SBElementArray):
+            return self.by_property(selector, value)
+
+        values = self.xa_elem.arrayByApplyingSelector_(selector)
+        if values is None:
+            return None
+
+        index = values.indexOfObject_(value)
+        if index == AppKit.NSNotFound:
+            return None
+        return self._new_element(
+            self.xa_elem.objectAtIndex_(index), XAPreviewDocument
+        )
+
     def by_name(self, name: str) -> Union["XAPreviewDocument", None]:
-        return self.by_property("name", name)
+        return self._by_selector("name", name)
 
     def by_path(
         self, path: Union[str, XABase.XAPath]
     ) -> Union["XAPreviewDocument", None]:
-        if isinstance(path, str):
-            path = XABase.XAPath(str)
-        return self.by_property("path", str(path.xa_elem))
+        if isinstance(path, XABase.XAPath):
+            path = path.path
+        else:
+            path = AppKit.NSURL.fileURLWithPath_(path).path()
+        return self._by_selector("path", path)
 
     def by_modified(self, modified: bool) -> Union["XAPreviewDocument", None]:
-        return self.by_property("modified", modified)
+        return self._by_selector("modified", modified)
 
+    @_pooled
     def get_clipboard_representation(self) -> list[AppKit.NSURL]:
         """Gets a clipboard-codable representation of each document in the list.
 
@@ -175,13 +298,28 @@ class XAPreviewDocumentList(XABase.XAList, XAClipboardCodable):
         :return: The document's file URL
         :rtype: list[AppKit.NSURL]
 
+        .. versionchanged:: 0.3.1
+
+           Builds the file URLs directly from the document paths instead of creating intermediate :class:`XABase.XAPath` objects.
+
         .. versionadded:: 0.0.8
         """
-        paths = self.path()
-        return [x.xa_elem for x in paths]
+        paths = self.xa_elem.arrayByApplyingSelector_("path") or []
+        return [AppKit.NSURL.fileURLWithPath_(x) for x in paths]
 
     def __repr__(self):
-        return "<" + str(type(self)) + str(self.name()) + ">"
+        names = self.xa_elem.arrayByApplyingSelector_("name")
+        if not names:
+            return "<" + str(type(self)) + "[]>"
+
+        # Names that repr() would quote differently or escape go through a Python list
+        joined = names.componentsJoinedByString_("', '")
+        if "\\" in joined or not joined.isprintable() or (
+            joined.count("'") != 2 * (len(names) - 1)
+        ):
+            return "<" + str(type(self)) + str(list(names)) + ">"
+
+        return "<" + str(type(self)) + "['" + joined + "']>"
 
 
 class XAPreviewDocument(
@@ -191,11 +329,38 @@ class XAPreviewDocument(
 
     .. seealso:: :class:`XAPreviewApplication`
 
+    .. versionchanged:: 0.3.1
+
+       Added the :attr:`_immutable` set of property names whose values are cached after the first read. The :attr:`name` and :attr:`path` properties support caching; :attr:`path` is cached by default.
+
     .. versionadded:: 0.0.1
     """
 
+    #: Names of properties whose values are cached after the first read. Either of ``"name"`` and ``"path"`` may be listed. Setting a property or saving the document through PyXA invalidates cached values, but changes made outside of PyXA (e.g. renaming or moving the file in Finder) are not detected.
+    _immutable = {"path"}
+
     def __init__(self, properties):
         super().__init__(properties)
+        self.xa_cache = {}
+
+    def _cached_get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Returns the value of a property, caching it if the property is listed in :attr:`_immutable`.
+
+        :param key: The name of the property
+        :type key: str
+        :param fetch: A function that retrieves the current value of the property
+        :type fetch: Callable[[], Any]
+        :return: The value of the property
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        if key not in self._immutable:
+            return fetch()
+
+        if key not in self.xa_cache:
+            self.xa_cache[key] = fetch()
+        return self.xa_cache[key]
 
     @property
     def properties(self) -> dict:
@@ -205,20 +370,27 @@ class XAPreviewDocument(
     @property
     def name(self) -> str:
         """The name of the document."""
-        return self.xa_elem.name()
+        return self._cached_get("name", self.xa_elem.name)
 
     @name.setter
     def name(self, name: str):
-        self.set_property("name", name)
+        self.set_property(_P_NAME, name)
+        self.xa_cache.pop("name", None)
 
     @property
     def path(self) -> XABase.XAPath:
-        """The document's file path."""
-        return XABase.XAPath(self.xa_elem.path())
+        """The document's file path.
+
+        .. versionchanged:: 0.3.1
+
+           The path is cached after the first read while ``"path"`` is listed in :attr:`_immutable`, which it is by default. The cache is cleared when the path is set or the document is saved through PyXA; if the file is moved or renamed by other means, remove ``"path"`` from :attr:`_immutable` to always read the current path.
+        """
+        return self._cached_get("path", lambda: XABase.XAPath(self.xa_elem.path()))
 
     @path.setter
     def path(self, path: XABase.XAPath):
-        self.set_property("path", path.xa_elem)
+        self.set_property(_P_PATH, path.xa_elem)
+        self.xa_cache.pop("path", None)
 
     @property
     def modified(self) -> bool:
@@ -262,6 +434,7 @@ class XAPreviewDocument(
         .. versionadded:: 0.0.4
         """
         self.xa_elem.saveAs_in_(None, file_path)
+        self.xa_cache.clear()
 
     def get_clipboard_representation(self) -> AppKit.NSURL:
         """Gets a clipboard-codable representation of the document.
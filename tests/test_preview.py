@@ -0,0 +1,108 @@
+"""Tests the Preview module.
+
+Expects Preview.app to have at least two documents open, at least one of which is unmodified.
+"""
+import PyXA
+import unittest
+
+class TestPreview(unittest.TestCase):
+    def setUp(self):
+        self.app = PyXA.Application("Preview")
+        self.docs = self.app.documents()
+
+    def test_preview_application_type(self):
+        self.assertIsInstance(self.app, PyXA.apps.Preview.XAPreviewApplication)
+        self.assertIsInstance(self.app, PyXA.XABaseScriptable.XASBApplication)
+
+    def test_preview_list_types(self):
+        self.assertIsInstance(self.docs, PyXA.apps.Preview.XAPreviewDocumentList)
+        self.assertIsInstance(self.docs[0], PyXA.apps.Preview.XAPreviewDocument)
+
+    def test_preview_doc_list_by_name(self):
+        name = self.docs.name()[1]
+        doc = self.docs.by_name(name)
+        self.assertIsInstance(doc, PyXA.apps.Preview.XAPreviewDocument)
+        self.assertEqual(doc.name, name)
+        self.assertIsNone(self.docs.by_name("PyXA Nonexistent Document.pdf"))
+
+    def test_preview_doc_list_by_path(self):
+        path = self.docs.path()[1]
+        doc1 = self.docs.by_path(path)
+        doc2 = self.docs.by_path(path.path)
+
+        self.assertIsInstance(doc1, PyXA.apps.Preview.XAPreviewDocument)
+        self.assertIsInstance(doc2, PyXA.apps.Preview.XAPreviewDocument)
+        self.assertEqual(doc1.path.path, path.path)
+        self.assertEqual(doc2.path.path, path.path)
+        self.assertIsNone(self.docs.by_path("/PyXA/Nonexistent/Document.pdf"))
+        self.assertIsNone(self.docs.by_path(PyXA.XABase.XAPath("/PyXA/Nonexistent/Document.pdf")))
+
+    def test_preview_doc_list_by_modified(self):
+        doc = self.docs.by_modified(False)
+        self.assertIsInstance(doc, PyXA.apps.Preview.XAPreviewDocument)
+        self.assertEqual(doc.modified, False)
+
+        if all(not x for x in self.docs.modified()):
+            self.assertIsNone(self.docs.by_modified(True))
+
+    def test_preview_sliced_doc_list_lookups(self):
+        sliced = self.docs[0:2]
+        name = self.docs.name()[1]
+        path = self.docs.path()[1]
+
+        self.assertIsInstance(sliced.by_name(name), PyXA.apps.Preview.XAPreviewDocument)
+        self.assertIsInstance(sliced.by_path(path), PyXA.apps.Preview.XAPreviewDocument)
+        self.assertIsInstance(sliced.by_path(path.path), PyXA.apps.Preview.XAPreviewDocument)
+        self.assertIsInstance(sliced.by_modified(self.docs.modified()[0]), PyXA.apps.Preview.XAPreviewDocument)
+        self.assertIsNone(sliced.by_name("PyXA Nonexistent Document.pdf"))
+
+    def test_preview_doc_list_path_view(self):
+        paths = self.docs.path()
+        names = self.docs.name()
+
+        self.assertEqual(len(paths), len(self.docs))
+        self.assertIsInstance(paths[0], PyXA.XABase.XAPath)
+        self.assertEqual(paths[0].name, names[0])
+        self.assertEqual(paths[-1].path, paths[len(paths) - 1].path)
+        self.assertEqual(paths[-1].name, names[-1])
+
+        sliced = paths[0:2]
+        self.assertIsInstance(sliced, PyXA.apps.Preview._XAPathListView)
+        self.assertEqual(len(sliced), 2)
+        self.assertEqual([x.path for x in sliced], [paths[0].path, paths[1].path])
+
+        items = [x for x in paths]
+        self.assertEqual(len(items), len(paths))
+        self.assertEqual(all(isinstance(x, PyXA.XABase.XAPath) for x in items), True)
+
+        self.assertEqual(paths, items)
+        self.assertEqual(paths, paths[:])
+        self.assertIsInstance(list(paths), list)
+        self.assertEqual(repr(paths), repr(items))
+
+    def test_preview_doc_path_cache(self):
+        doc = self.docs[0]
+        path = doc.path
+
+        self.assertIn("path", doc.xa_cache)
+        self.assertIs(doc.path, path)
+
+        doc.path = path
+        self.assertNotIn("path", doc.xa_cache)
+        self.assertEqual(doc.path, path)
+        self.assertIn("path", doc.xa_cache)
+
+        doc.save()
+        self.assertNotIn("path", doc.xa_cache)
+        self.assertEqual(doc.path, path)
+
+    def test_preview_doc_list_iteration(self):
+        docs = self.app.documents()
+        items = [doc for doc in docs]
+
+        self.assertEqual(len(items), len(docs))
+        self.assertEqual(all(isinstance(x, PyXA.apps.Preview.XAPreviewDocument) for x in items), True)
+        self.assertEqual([x.name for x in items], docs.name())
+
+if __name__ == '__main__':
+    unittest.main()